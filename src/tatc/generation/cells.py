@@ -12,7 +12,6 @@ import geopandas as gpd
 from shapely.geometry import Polygon, MultiPolygon
 
 from .points import (
-    _compute_equally_spaced_point_id,
     _generate_equally_spaced_indices,
     _get_bounds,
 )
@@ -92,85 +91,37 @@ def _generate_equally_spaced_cells(
     )
     # get the bounds of the mask
     min_longitude, min_latitude, max_longitude, max_latitude = _get_bounds(mask)
+    # hoist the grid dimensions used by the flattened cell id; ids increment
+    # west-to-east followed by south-to-north with a first cell at -180
+    # degrees longitude and close to -90 degrees latitude
+    n_longitude = int(360 / theta_longitude)
+    n_latitude = int(360 / theta_latitude)
+    # generate the cell ids and geometry in a single pass over the indices,
+    # computing each corner coordinate once
+    cell_id = []
+    geometry = []
+    for i, j in indices:
+        west = min_longitude if strips == "lat" else -180 + i * theta_longitude
+        east = max_longitude if strips == "lat" else -180 + (i + 1) * theta_longitude
+        south = min_latitude if strips == "lon" else -90 + j * theta_latitude
+        north = max_latitude if strips == "lon" else -90 + (j + 1) * theta_latitude
+        cell_id.append(j * n_latitude + i % n_longitude)
+        geometry.append(
+            Polygon(
+                [
+                    (east, south, elevation),
+                    (east, north, elevation),
+                    (west, north, elevation),
+                    (west, south, elevation),
+                    (east, south, elevation),
+                ]
+            )
+        )
     # create a geodataframe in the WGS84 reference frame
     gdf = gpd.GeoDataFrame(
         {
-            "cell_id": [
-                _compute_equally_spaced_point_id(i, j, theta_longitude, theta_latitude)
-                for (i, j) in indices
-            ],
-            "geometry": [
-                Polygon(
-                    [
-                        (
-                            (
-                                max_longitude
-                                if strips == "lat"
-                                else -180 + (i + 1) * theta_longitude
-                            ),
-                            (
-                                min_latitude
-                                if strips == "lon"
-                                else -90 + j * theta_latitude
-                            ),
-                            elevation,
-                        ),
-                        (
-                            (
-                                max_longitude
-                                if strips == "lat"
-                                else -180 + (i + 1) * theta_longitude
-                            ),
-                            (
-                                max_latitude
-                                if strips == "lon"
-                                else -90 + (j + 1) * theta_latitude
-                            ),
-                            elevation,
-                        ),
-                        (
-                            (
-                                min_longitude
-                                if strips == "lat"
-                                else -180 + i * theta_longitude
-                            ),
-                            (
-                                max_latitude
-                                if strips == "lon"
-                                else -90 + (j + 1) * theta_latitude
-                            ),
-                            elevation,
-                        ),
-                        (
-                            (
-                                min_longitude
-                                if strips == "lat"
-                                else -180 + i * theta_longitude
-                            ),
-                            (
-                                min_latitude
-                                if strips == "lon"
-                                else -90 + j * theta_latitude
-                            ),
-                            elevation,
-                        ),
-                        (
-                            (
-                                max_longitude
-                                if strips == "lat"
-                                else -180 + (i + 1) * theta_longitude
-                            ),
-                            (
-                                min_latitude
-                                if strips == "lon"
-                                else -90 + j * theta_latitude
-                            ),
-                            elevation,
-                        ),
-                    ]
-                )
-                for (i, j) in indices
-            ],
+            "cell_id": cell_id,
+            "geometry": geometry,
         },
         crs="EPSG:4326",
     )
@@ -8,54 +8,42 @@ Methods to generate geospatial points to sample data.
 from typing import Optional, Union
 
 import numpy as np
+import pandas as pd
 import geopandas as gpd
-from numba import njit
-from shapely.geometry import Point, Polygon, MultiPolygon
+from shapely import GeometryType, contains_xy, from_ragged_array, prepare
+from shapely.geometry import Polygon, MultiPolygon
 
 from ..constants import EARTH_MEAN_RADIUS
 from ..utils import compute_number_samples
 
 
-@njit
-def _compute_fibonacci_lattice_point_latitude(index: int, count: int) -> float:
+def _build_point_geometry(
+    longitudes: np.ndarray, latitudes: np.ndarray, elevation: float
+) -> np.ndarray:
     """
-    Fast method to compute the latitude for a Fibonacci lattice point.
+    Builds an array of point geometry from coordinate arrays.
 
     Args:
-        index (int): The zero-based point index.
-        count (int): The number of global samples.
-
-    Returns:
-        float: The latitude (degrees) of this point.
-    """
-    # compute latitude, starting from the southern hemisphere and placing
-    # neither first nor last points at poles
-    return np.degrees(np.arcsin(2 * (index + 1) / (count + 2) - 1))
-
-
-@njit
-def _compute_fibonacci_lattice_point_longitude(index: int) -> float:
-    """
-    Fast method to compute the latitude for a Fibonacci lattice point.
-
-    Args:
-        index (int): The zero-based point index.
+        longitudes (numpy.ndarray): The point longitudes (degrees).
+        latitudes (numpy.ndarray): The point latitudes (degrees).
+        elevation (float): The elevation (meters) above the datum in the WGS 84
+            coordinate system.
 
     Returns:
-        float: The longitude (degrees) of this point.
+        numpy.ndarray: the array of point geometry
     """
-    phi = (1 + np.sqrt(5)) / 2  # golden ratio
-    # compute longitude and return value on interval [-180, 180]
-    longitude = np.mod(360 * index / phi, 360)
-    if longitude > 180:
-        longitude -= 360
-    return longitude
+    # build the geometry array from one contiguous coordinate buffer
+    coords = np.column_stack(
+        [longitudes, latitudes, np.full(len(longitudes), float(elevation))]
+    )
+    return from_ragged_array(GeometryType.POINT, coords)
 
 
 def generate_fibonacci_lattice_points(
     distance: float,
     elevation: float = 0,
     mask: Optional[Union[Polygon, MultiPolygon]] = None,
+    chunk_size: Optional[int] = None,
 ) -> gpd.GeoDataFrame:
     """
     Generates geodetic points following a Fibonacci lattice.
@@ -74,6 +62,8 @@ def generate_fibonacci_lattice_points(
             coordinate system.
         mask (Polygon or MultiPolygon):  An optional mask to constrain points
             using WGS84 (EPSG:4326) geodetic coordinates in a Polygon or MultiPolygon.
+        chunk_size (int): An optional maximum number of candidate points to
+            process per batch, bounding peak memory for small distances.
 
     Returns:
         geopandas.GeoDataFrame: the data frame of generated points
@@ -81,66 +71,102 @@ def generate_fibonacci_lattice_points(
 
     # determine the number of global samples to achieve average sample distance
     samples = compute_number_samples(distance)
-    if isinstance(mask, (Polygon, MultiPolygon)):
-        if not mask.is_valid:
-            raise ValueError("Mask is not a valid Polygon or MultiPolygon.")
-        total_bounds = mask.bounds
-    else:
-        total_bounds = [-180, -90, 180, 90]
-    min_longitude = total_bounds[0]
-    # if mask, use the total_bounds to filter relevant points
-    min_longitude = total_bounds[0]
-    min_latitude = total_bounds[1]
-    max_longitude = 180 if total_bounds[2] == -180 else total_bounds[2]
-    max_latitude = total_bounds[3]
-    # enumerate the indices within the bounding box region
+    # get the latitude bounds of the mask (longitude filtering happens in the
+    # inner helper)
+    _, min_latitude, _, max_latitude = _get_bounds(mask)
     if mask is None:
-        # if no mask, enumerate the indices for global coverage
-        indices = range(samples)
+        # enumerate the global sample indices
+        index_start, index_stop = 0, samples
     else:
-        indices = [
-            i
-            for i in range(samples)
-            if (
-                min_latitude
-                <= _compute_fibonacci_lattice_point_latitude(i, samples)
-                <= max_latitude
+        # latitude increases monotonically with index, so the latitude band of
+        # the mask maps to a contiguous index interval in closed form (padded
+        # by one index on each side to guard against rounding)
+        index_min = np.ceil(
+            (np.sin(np.radians(min_latitude)) + 1) * (samples + 2) / 2 - 1
+        )
+        index_max = np.floor(
+            (np.sin(np.radians(max_latitude)) + 1) * (samples + 2) / 2 - 1
+        )
+        index_start = max(int(index_min) - 1, 0)
+        index_stop = min(int(index_max) + 2, samples)
+    if chunk_size is None:
+        # process all candidate indices in a single batch
+        return _generate_fibonacci_lattice_points(
+            np.arange(index_start, index_stop), samples, elevation, mask
+        )
+    # process candidate indices in batches of chunk_size and concatenate
+    return pd.concat(
+        [
+            _generate_fibonacci_lattice_points(
+                np.arange(start, min(start + chunk_size, index_stop)),
+                samples,
+                elevation,
+                mask,
             )
-            and (
-                min_longitude
-                <= (
-                    _compute_fibonacci_lattice_point_longitude(i) + 360
-                    if max_longitude > 180
-                    and _compute_fibonacci_lattice_point_longitude(i) < 0
-                    else _compute_fibonacci_lattice_point_longitude(i)
-                )
-                <= max_longitude
+            for start in range(
+                index_start, max(index_stop, index_start + 1), chunk_size
             )
-        ]
+        ],
+        ignore_index=True,
+    )
+
+
+def _generate_fibonacci_lattice_points(
+    index: np.ndarray,
+    samples: int,
+    elevation: float = 0,
+    mask: Optional[Union[Polygon, MultiPolygon]] = None,
+) -> gpd.GeoDataFrame:
+    """
+    Generates geodetic points for a slice of Fibonacci lattice indices.
+
+    Args:
+        index (numpy.ndarray): The global sample indices to generate.
+        samples (int): The total number of global samples.
+        elevation (float): The elevation (meters) above the datum in the WGS 84
+            coordinate system.
+        mask (Polygon or MultiPolygon):  An optional mask to constrain points
+            using WGS84 (EPSG:4326) geodetic coordinates in a Polygon or MultiPolygon.
+
+    Returns:
+        geopandas.GeoDataFrame: the data frame of generated points
+    """
+    # get the bounds of the mask
+    min_longitude, min_latitude, max_longitude, max_latitude = _get_bounds(mask)
+    # compute latitude, starting from the southern hemisphere and placing
+    # neither first nor last points at poles
+    latitudes = np.degrees(np.arcsin(2 * (index + 1) / (samples + 2) - 1))
+    phi = (1 + np.sqrt(5)) / 2  # golden ratio
+    # compute longitude on the interval [-180, 180] (branchless wrap)
+    longitudes = np.mod(360 * index / phi + 180, 360) - 180
+    if mask is not None:
+        if max_longitude > 180:
+            # mask crosses the antimeridian: shift longitudes to [0, 360]
+            longitudes = np.where(longitudes < 0, longitudes + 360, longitudes)
+        # filter to the indices within the bounding box region
+        in_bounds = (
+            (min_latitude <= latitudes)
+            & (latitudes <= max_latitude)
+            & (min_longitude <= longitudes)
+            & (longitudes <= max_longitude)
+        )
+        index = index[in_bounds]
+        latitudes = latitudes[in_bounds]
+        longitudes = longitudes[in_bounds]
+        # filter to the points contained within the (prepared) mask
+        prepare(mask)
+        in_mask = contains_xy(mask, longitudes, latitudes)
+        index = index[in_mask]
+        latitudes = latitudes[in_mask]
+        longitudes = longitudes[in_mask]
     # create a geodataframe in the WGS84 coordinate reference system (EPSG:4326)
     gdf = gpd.GeoDataFrame(
         {
-            "point_id": indices,
-            "geometry": [
-                Point(
-                    (
-                        _compute_fibonacci_lattice_point_longitude(i) + 360
-                        if mask is not None
-                        and max_longitude > 180
-                        and _compute_fibonacci_lattice_point_longitude(i) < 0
-                        else _compute_fibonacci_lattice_point_longitude(i)
-                    ),
-                    _compute_fibonacci_lattice_point_latitude(i, samples),
-                    elevation,
-                )
-                for i in indices
-            ],
+            "point_id": index,
+            "geometry": _build_point_geometry(longitudes, latitudes, elevation),
         },
         crs="EPSG:4326",
     )
-    # clip the geodataframe to the supplied mask, if required
-    if mask is not None:
-        gdf = gpd.clip(gdf, mask).reset_index(drop=True)
     # return the final geodataframe
     return gdf
 
@@ -176,27 +202,6 @@ def generate_equally_spaced_points(
     )
 
 
-@njit
-def _compute_equally_spaced_point_id(
-    i: int, j: int, theta_i: float, theta_j: float
-) -> int:
-    """
-    Fast method to compute the flattened id for an equally spaced grid point.
-    Indices increment west-to-east followed by south-to-north with a first
-    point at -180 degrees latitude and close to -90 degrees latitude.
-
-    Args:
-        i (int): The zero-based longitude index.
-        j (int): The zero-based latitude index.
-        theta_i (float): The angular step in longitude (degrees).
-        theta_j (float): The angular step in latitude (degrees).
-
-    Returns:
-        int: The id of this point.
-    """
-    return int(j * int(360 / theta_j) + np.mod(i, int(360 / theta_i)))
-
-
 def _get_bounds(mask: Union[Polygon, MultiPolygon]) -> tuple:
     """
     Generates a tuple of bounds for a polygon mask.
@@ -251,8 +256,8 @@ def _generate_equally_spaced_indices(
         return [
             (0, j)
             for j in range(
-                int(np.round((min_latitude + 90) / theta_latitude)),
-                int(np.round((max_latitude + 90) / theta_latitude)),
+                int(round((min_latitude + 90) / theta_latitude)),
+                int(round((max_latitude + 90) / theta_latitude)),
             )
         ]
     if strips == "lon":
@@ -260,20 +265,20 @@ def _generate_equally_spaced_indices(
         return [
             (i, 0)
             for i in range(
-                int(np.round((min_longitude + 180) / theta_longitude)),
-                int(np.round((max_longitude + 180) / theta_longitude)),
+                int(round((min_longitude + 180) / theta_longitude)),
+                int(round((max_longitude + 180) / theta_longitude)),
             )
         ]
     # generate indices over the two-dimensional latitude/longitude range
     return [
         (i, j)
         for j in range(
-            int(np.round((min_latitude + 90) / theta_latitude)),
-            int(np.round((max_latitude + 90) / theta_latitude)),
+            int(round((min_latitude + 90) / theta_latitude)),
+            int(round((max_latitude + 90) / theta_latitude)),
         )
         for i in range(
-            int(np.round((min_longitude + 180) / theta_longitude)),
-            int(np.round((max_longitude + 180) / theta_longitude)),
+            int(round((min_longitude + 180) / theta_longitude)),
+            int(round((max_longitude + 180) / theta_longitude)),
         )
     ]
 
@@ -305,32 +310,44 @@ def _generate_equally_spaced_points(
         geopandas.GeoDataFrame: the data frame of generated points
     """
 
-    # generate grid cells over the filtered region
-    indices = _generate_equally_spaced_indices(
-        theta_longitude,
-        theta_latitude,
-        mask,
+    # get the bounds of the mask
+    min_longitude, min_latitude, max_longitude, max_latitude = _get_bounds(mask)
+    # enumerate the grid indices over the two-dimensional latitude/longitude range
+    index_i, index_j = np.meshgrid(
+        np.arange(
+            int(round((min_longitude + 180) / theta_longitude)),
+            int(round((max_longitude + 180) / theta_longitude)),
+        ),
+        np.arange(
+            int(round((min_latitude + 90) / theta_latitude)),
+            int(round((max_latitude + 90) / theta_latitude)),
+        ),
     )
+    index_i = index_i.ravel()
+    index_j = index_j.ravel()
+    # compute the flattened id of each point with integer arithmetic; ids
+    # increment west-to-east followed by south-to-north with a first point
+    # at -180 degrees longitude and close to -90 degrees latitude
+    n_longitude = int(360 / theta_longitude)
+    n_latitude = int(360 / theta_latitude)
+    point_id = index_j * n_latitude + index_i % n_longitude
+    # compute the coordinates of each point
+    longitudes = -180 + (index_i + 0.5) * theta_longitude
+    latitudes = -90 + (index_j + 0.5) * theta_latitude
+    if mask is not None:
+        # filter to the points contained within the (prepared) mask
+        prepare(mask)
+        in_mask = contains_xy(mask, longitudes, latitudes)
+        point_id = point_id[in_mask]
+        longitudes = longitudes[in_mask]
+        latitudes = latitudes[in_mask]
     # create a geodataframe in the WGS84 reference frame
     gdf = gpd.GeoDataFrame(
         {
-            "point_id": [
-                _compute_equally_spaced_point_id(i, j, theta_longitude, theta_latitude)
-                for (i, j) in indices
-            ],
-            "geometry": [
-                Point(
-                    -180 + (i + 0.5) * theta_longitude,
-                    -90 + (j + 0.5) * theta_latitude,
-                    elevation,
-                )
-                for (i, j) in indices
-            ],
+            "point_id": point_id,
+            "geometry": _build_point_geometry(longitudes, latitudes, elevation),
         },
         crs="EPSG:4326",
     )
-    # clip the geodataframe to the supplied mask, if required
-    if mask is not None:
-        gdf = gpd.clip(gdf, mask).reset_index(drop=True)
     # return the final geodataframe
     return gdf
@@ -4,64 +4,161 @@ Utility functions.
 
 @author: Paul T. Grogan <paul.grogan@asu.edu>
 """
+
+import math
+from functools import lru_cache
 from typing import Union
 
 import numpy as np
-from numba import njit
+from numba import vectorize
 import geopandas as gpd
+from shapely import get_coordinates, get_parts, prepare, transform
 from shapely.geometry import Polygon, MultiPolygon, GeometryCollection, LineString
 from shapely.ops import split
 
 from . import constants
 
+# float copies of physical constants referenced inside the numba kernels,
+# giving the compiler clean typed literals to embed in the cached code
+_EARTH_MEAN_RADIUS = float(constants.EARTH_MEAN_RADIUS)
+_EARTH_MU = float(constants.EARTH_MU)
+_EARTH_SIDEREAL_DAY_S = float(constants.EARTH_SIDEREAL_DAY_S)
+_EARTH_SURFACE_AREA = float(constants.EARTH_SURFACE_AREA)
+
+# degree/radian conversion factors (avoids a function call in scalar kernels)
+_D2R = math.pi / 180
+_R2D = 180 / math.pi
+
+# cutting lines for polygon splitting, constructed once and prepared to
+# accelerate repeated geometry predicates
+_NORTH_POLE_LINE = LineString([(-360, 90), (360, 90)])
+_NORTH_PRIME_MERIDIAN_LINE = LineString([(0, 90), (0, 180)])
+_SOUTH_POLE_LINE = LineString([(-360, -90), (360, -90)])
+_SOUTH_PRIME_MERIDIAN_LINE = LineString([(0, -90), (0, -180)])
+_ANTIMERIDIAN_WEST_LINE = LineString([(-180, -180), (-180, 180)])
+_ANTIMERIDIAN_EAST_LINE = LineString([(180, -180), (180, 180)])
+for _line in (
+    _NORTH_POLE_LINE,
+    _NORTH_PRIME_MERIDIAN_LINE,
+    _SOUTH_POLE_LINE,
+    _SOUTH_PRIME_MERIDIAN_LINE,
+    _ANTIMERIDIAN_WEST_LINE,
+    _ANTIMERIDIAN_EAST_LINE,
+):
+    prepare(_line)
+
+
+def _memoize_scalars(kernel):
+    """
+    Wraps an elementwise kernel with a memoized fast path for scalar
+    arguments. Scalar calls bypass the ufunc dispatch and boxing overhead
+    by caching previously computed results; array arguments fall through
+    to the vectorized kernel.
+
+    Args:
+        kernel: The elementwise kernel to wrap.
+
+    Returns:
+        Callable: The dispatching function.
+    """
+
+    @lru_cache(maxsize=1024)
+    def scalar(*args):
+        return float(kernel(*args))
+
+    def dispatch(*args):
+        if all(isinstance(arg, (int, float)) for arg in args):
+            return scalar(*args)
+        return kernel(*args)
 
-@njit
-def mean_anomaly_to_true_anomaly(mean_anomaly: float, eccentricity: float = 0) -> float:
+    return dispatch
+
+
+@vectorize(["float64(float64, float64)"], cache=True, fastmath=True)
+def _mean_anomaly_to_true_anomaly(mean_anomaly, eccentricity):
+    """
+    Elementwise kernel for :func:`mean_anomaly_to_true_anomaly`.
+    """
+    mean_anomaly_rad = mean_anomaly * _D2R
+    # evaluate sin/cos once and derive sin(2x)/sin(3x) by multiple-angle
+    # identities; eccentricity series evaluated in Horner form; keep the
+    # sin/cos calls adjacent so LLVM can fuse them into a single sincos
+    # under fastmath
+    sin_1 = math.sin(mean_anomaly_rad)
+    cos_1 = math.cos(mean_anomaly_rad)
+    sin_2 = 2 * sin_1 * cos_1
+    sin_3 = sin_1 * (3 - 4 * sin_1 * sin_1)
+    true_anomaly_rad = mean_anomaly_rad + eccentricity * (
+        2 * sin_1
+        + eccentricity
+        * ((5 / 4) * sin_2 + eccentricity * ((13 / 12) * sin_3 - (1 / 4) * sin_1))
+    )
+    return true_anomaly_rad * _R2D
+
+
+def mean_anomaly_to_true_anomaly(
+    mean_anomaly: Union[float, np.ndarray],
+    eccentricity: Union[float, np.ndarray] = 0,
+) -> Union[float, np.ndarray]:
     """
     Converts mean anomaly to true anomaly.
 
     Args:
-        mean_anomaly (float): The mean anomaly (degrees).
-        true_anomaly (float): The orbit eccentricity.
+        mean_anomaly (float or numpy.ndarray): The mean anomaly (degrees).
+        eccentricity (float or numpy.ndarray): The orbit eccentricity.
 
     Returns:
-        float: The true anomaly (degrees).
-    """
-    mean_anomaly_rad = np.radians(mean_anomaly)
-    true_anomaly_rad = (
-        mean_anomaly_rad
-        + (2 * eccentricity - (1 / 4) * eccentricity**3) * np.sin(mean_anomaly_rad)
-        + (5 / 4) * eccentricity**2 * np.sin(2 * mean_anomaly_rad)
-        + (13 / 12) * eccentricity**3 * np.sin(3 * mean_anomaly_rad)
+        float or numpy.ndarray: The true anomaly (degrees).
+    """
+    return _mean_anomaly_to_true_anomaly(mean_anomaly, eccentricity)
+
+
+@vectorize(["float64(float64, float64)"], cache=True, fastmath=True)
+def _true_anomaly_to_mean_anomaly(true_anomaly, eccentricity):
+    """
+    Elementwise kernel for :func:`true_anomaly_to_mean_anomaly`.
+    """
+    true_anomaly_rad = true_anomaly * _D2R
+    # evaluate sin/cos once and derive sin(2x)/sin(3x)/sin(4x) by
+    # multiple-angle identities; eccentricity series evaluated in Horner
+    # form; keep the sin/cos calls adjacent so LLVM can fuse them into a
+    # single sincos under fastmath
+    sin_1 = math.sin(true_anomaly_rad)
+    cos_1 = math.cos(true_anomaly_rad)
+    sin_2 = 2 * sin_1 * cos_1
+    cos_2 = 1 - 2 * sin_1 * sin_1
+    sin_3 = sin_1 * (3 - 4 * sin_1 * sin_1)
+    sin_4 = 2 * sin_2 * cos_2
+    mean_anomaly_rad = true_anomaly_rad + eccentricity * (
+        -2 * sin_1
+        + eccentricity
+        * (
+            (3 / 4) * sin_2
+            + eccentricity
+            * (-(1 / 3) * sin_3 + eccentricity * ((1 / 8) * sin_2 + (5 / 32) * sin_4))
+        )
     )
-    return np.degrees(true_anomaly_rad)
+    return mean_anomaly_rad * _R2D
 
 
-@njit
-def true_anomaly_to_mean_anomaly(true_anomaly: float, eccentricity: float = 0) -> float:
+def true_anomaly_to_mean_anomaly(
+    true_anomaly: Union[float, np.ndarray],
+    eccentricity: Union[float, np.ndarray] = 0,
+) -> Union[float, np.ndarray]:
     """
     Converts true anomaly to mean anomaly.
 
     Args:
-        true_anomaly (float): The true anomaly (degrees).
-        eccentricity (float): The orbit eccentricity.
+        true_anomaly (float or numpy.ndarray): The true anomaly (degrees).
+        eccentricity (float or numpy.ndarray): The orbit eccentricity.
 
     Returns:
-        float: The mean anomaly (degrees).
-    """
-    true_anomaly_rad = np.radians(true_anomaly)
-    mean_anomaly_rad = (
-        true_anomaly_rad
-        - 2 * eccentricity * np.sin(true_anomaly_rad)
-        + ((3 / 4) * eccentricity**2 + (1 / 8) * eccentricity**4)
-        * np.sin(2 * true_anomaly_rad)
-        - (1 / 3) * eccentricity**3 * np.sin(3 * true_anomaly_rad)
-        + (5 / 32) * eccentricity**4 * np.sin(4 * true_anomaly_rad)
-    )
-    return np.degrees(mean_anomaly_rad)
+        float or numpy.ndarray: The mean anomaly (degrees).
+    """
+    return _true_anomaly_to_mean_anomaly(true_anomaly, eccentricity)
 
 
-@njit
+@lru_cache(maxsize=1024)
 def compute_number_samples(distance: float) -> int:
     """
     Compute the number of global samples required to achieve a typical
@@ -74,233 +171,382 @@ def compute_number_samples(distance: float) -> int:
         int: The number of global samples.
     """
     # compute the angular distance of each sample (assuming mean sphere)
-    theta = distance / constants.EARTH_MEAN_RADIUS
+    theta = distance / _EARTH_MEAN_RADIUS
     # compute the distance from the center of earth to conic plane (assuming sphere)
-    radius = constants.EARTH_MEAN_RADIUS * np.cos(theta / 2)
+    radius = _EARTH_MEAN_RADIUS * math.cos(theta / 2)
     # compute the distance from the conic plane to the surface (assuming sphere)
-    height = constants.EARTH_MEAN_RADIUS - radius
+    height = _EARTH_MEAN_RADIUS - radius
     # compute the sperical cap area covered by the sample (assuming sphere)
     # https://en.wikipedia.org/wiki/Spherical_cap
-    sample_area = 2 * np.pi * constants.EARTH_MEAN_RADIUS * height
+    sample_area = 2 * math.pi * _EARTH_MEAN_RADIUS * height
     # return the fraction of earth-to-sample area
-    return int(constants.EARTH_SURFACE_AREA / sample_area)
+    return int(_EARTH_SURFACE_AREA / sample_area)
+
+
+@vectorize(["float64(float64, float64, float64)"], cache=True, fastmath=True)
+def _swath_width_to_field_of_regard(altitude, swath_width, elevation):
+    """
+    Elementwise kernel for :func:`swath_width_to_field_of_regard`.
+    """
+    # hoist the radius sums reused across expressions
+    radius_elevation = _EARTH_MEAN_RADIUS + elevation
+    radius_altitude = _EARTH_MEAN_RADIUS + altitude
+    # rho is the angular radius of the earth viewed by the satellite
+    sin_rho = radius_elevation / radius_altitude
+    # lambda is the Earth central angle
+    sin_lambda = math.sin((swath_width / 2) / radius_elevation)
+    # eta is the angular radius of the region viewable by the satellite
+    # (cos(arcsin(x)) collapsed to sqrt(1 - x*x))
+    cos_lambda = math.sqrt(1 - sin_lambda * sin_lambda)
+    tan_eta = sin_rho * sin_lambda / (1 - sin_rho * cos_lambda)
+    return 2 * math.atan(tan_eta) * _R2D
+
+
+_swath_width_to_field_of_regard_cached = _memoize_scalars(
+    _swath_width_to_field_of_regard
+)
 
 
-@njit
 def swath_width_to_field_of_regard(
-    altitude: float, swath_width: float, elevation: float = 0
-) -> float:
+    altitude: Union[float, np.ndarray],
+    swath_width: Union[float, np.ndarray],
+    elevation: Union[float, np.ndarray] = 0,
+) -> Union[float, np.ndarray]:
     """
     Fast conversion from swath width to field of regard.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        swath_width (float): Observation diameter (meters) at specified elevation.
-        elevation (float): Elevation (meters) above WGS 84 datum to observe.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        swath_width (float or numpy.ndarray): Observation diameter (meters) at
+            specified elevation.
+        elevation (float or numpy.ndarray): Elevation (meters) above WGS 84
+            datum to observe.
 
     Returns:
-        float: The field of regard (degrees).
+        float or numpy.ndarray: The field of regard (degrees).
+    """
+    return _swath_width_to_field_of_regard_cached(altitude, swath_width, elevation)
+
+
+@vectorize(["float64(float64, float64, float64)"], cache=True, fastmath=True)
+def _field_of_regard_to_swath_width(altitude, field_of_regard, elevation):
     """
+    Elementwise kernel for :func:`field_of_regard_to_swath_width`.
+    """
+    # hoist the radius sums reused across expressions
+    radius_elevation = _EARTH_MEAN_RADIUS + elevation
+    radius_altitude = _EARTH_MEAN_RADIUS + altitude
     # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = (constants.EARTH_MEAN_RADIUS + elevation) / (
-        constants.EARTH_MEAN_RADIUS + altitude
-    )
-    # lambda is the Earth central angle
-    sin_lambda = np.sin((swath_width / 2) / (constants.EARTH_MEAN_RADIUS + elevation))
+    sin_rho = radius_elevation / radius_altitude
     # eta is the angular radius of the region viewable by the satellite
-    tan_eta = sin_rho * sin_lambda / (1 - sin_rho * np.cos(np.arcsin(sin_lambda)))
-    return np.degrees(2 * np.arctan(tan_eta))
+    sin_eta = np.fmin(sin_rho, math.sin(field_of_regard * _D2R / 2))
+    # epsilon is the min satellite elevation for obs (grazing angle)
+    cos_epsilon = sin_eta / sin_rho
+    sin_epsilon = math.sqrt(1 - cos_epsilon * cos_epsilon)
+    cos_eta = math.sqrt(1 - sin_eta * sin_eta)
+    # lambda is the Earth central angle: arcsin(cos_epsilon) - arcsin(sin_eta),
+    # fused via the angle-difference identity into a single arctan2
+    _lambda = math.atan2(
+        cos_epsilon * cos_eta - sin_epsilon * sin_eta,
+        sin_epsilon * cos_eta + cos_epsilon * sin_eta,
+    )
+    return 2 * radius_elevation * _lambda
+
+
+_field_of_regard_to_swath_width_cached = _memoize_scalars(
+    _field_of_regard_to_swath_width
+)
 
 
-@njit
 def field_of_regard_to_swath_width(
-    altitude: float, field_of_regard: float, elevation: float = 0
-) -> float:
+    altitude: Union[float, np.ndarray],
+    field_of_regard: Union[float, np.ndarray],
+    elevation: Union[float, np.ndarray] = 0,
+) -> Union[float, np.ndarray]:
     """
     Fast conversion from field of regard to swath width.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        field_of_regard (float): Angular width (degrees) of observation.
-        elevation (float): Elevation (meters) above WGS 84 datum to observe.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        field_of_regard (float or numpy.ndarray): Angular width (degrees) of
+            observation.
+        elevation (float or numpy.ndarray): Elevation (meters) above WGS 84
+            datum to observe.
 
     Returns:
-        float: The observation diameter (meters) at the specified elevation.
+        float or numpy.ndarray: The observation diameter (meters) at the
+        specified elevation.
+    """
+    return _field_of_regard_to_swath_width_cached(altitude, field_of_regard, elevation)
+
+
+@vectorize(["float64(float64, float64, float64)"], cache=True, fastmath=True)
+def _compute_field_of_regard(altitude, min_elevation_angle, elevation):
+    """
+    Elementwise kernel for :func:`compute_field_of_regard`.
     """
     # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = (constants.EARTH_MEAN_RADIUS + elevation) / (
-        constants.EARTH_MEAN_RADIUS + altitude
-    )
-    # eta is the angular radius of the region viewable by the satellite
-    sin_eta = min(sin_rho, np.sin(np.radians(field_of_regard) / 2))
+    sin_rho = (_EARTH_MEAN_RADIUS + elevation) / (_EARTH_MEAN_RADIUS + altitude)
     # epsilon is the min satellite elevation for obs (grazing angle)
-    cos_epsilon = sin_eta / sin_rho
-    # lambda is the Earth central angle
-    _lambda = np.pi / 2 - np.arcsin(sin_eta) - np.arccos(cos_epsilon)
-    return 2 * (constants.EARTH_MEAN_RADIUS + elevation) * _lambda
+    cos_epsilon = math.cos(min_elevation_angle * _D2R)
+    # eta is the angular radius of the region viewable by the satellite
+    sin_eta = sin_rho * cos_epsilon
+    return math.asin(sin_eta) * 2 * _R2D
+
+
+_compute_field_of_regard_cached = _memoize_scalars(_compute_field_of_regard)
 
 
-@njit
 def compute_field_of_regard(
-    altitude: float, min_elevation_angle: float, elevation: float = 0
-) -> float:
+    altitude: Union[float, np.ndarray],
+    min_elevation_angle: Union[float, np.ndarray],
+    elevation: Union[float, np.ndarray] = 0,
+) -> Union[float, np.ndarray]:
     """
     Fast computation of field of regard for observation with a minimum altitude angle.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        min_elevation_angle (float): The minimum elevation angle (degrees) for observation.
-        elevation (float): Elevation (meters) above WGS 84 datum to observe.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        min_elevation_angle (float or numpy.ndarray): The minimum elevation
+            angle (degrees) for observation.
+        elevation (float or numpy.ndarray): Elevation (meters) above WGS 84
+            datum to observe.
 
     Returns:
-        float: Angular width (degrees) of observation.
+        float or numpy.ndarray: Angular width (degrees) of observation.
+    """
+    return _compute_field_of_regard_cached(altitude, min_elevation_angle, elevation)
+
+
+@vectorize(["float64(float64, float64, float64)"], cache=True, fastmath=True)
+def _compute_min_elevation_angle(altitude, field_of_regard, elevation):
+    """
+    Elementwise kernel for :func:`compute_min_elevation_angle`.
     """
-    # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = (constants.EARTH_MEAN_RADIUS + elevation) / (
-        constants.EARTH_MEAN_RADIUS + altitude
-    )
-    # epsilon is the min satellite elevation for obs (grazing angle)
-    cos_epsilon = np.cos(np.radians(min_elevation_angle))
     # eta is the angular radius of the region viewable by the satellite
-    sin_eta = sin_rho * cos_epsilon
-    return np.degrees(np.arcsin(sin_eta) * 2)
+    sin_eta = math.sin(field_of_regard * _D2R / 2)
+    # rho is the angular radius of the earth viewed by the satellite
+    sin_rho = (_EARTH_MEAN_RADIUS + elevation) / (_EARTH_MEAN_RADIUS + altitude)
+    # epsilon is the min satellite elevation for obs (grazing angle);
+    # branchless: the clamped radicand collapses saturated geometries
+    # (cos_epsilon above 1) to exactly zero through atan2
+    cos_epsilon = sin_eta / sin_rho
+    sin_epsilon = math.sqrt(np.fmax(0.0, 1 - cos_epsilon * cos_epsilon))
+    return math.atan2(sin_epsilon, cos_epsilon) * _R2D
+
+
+_compute_min_elevation_angle_cached = _memoize_scalars(_compute_min_elevation_angle)
 
 
-@njit
 def compute_min_elevation_angle(
-    altitude: float, field_of_regard: float, elevation: float = 0
-) -> float:
+    altitude: Union[float, np.ndarray],
+    field_of_regard: Union[float, np.ndarray],
+    elevation: Union[float, np.ndarray] = 0,
+) -> Union[float, np.ndarray]:
     """
     Fast computation of minimum elevation angle required to observe a point.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        field_of_regard (float): Angular width (degrees) of observation.
-        elevation (float): Elevation (meters) above WGS 84 datum to observe.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        field_of_regard (float or numpy.ndarray): Angular width (degrees) of
+            observation.
+        elevation (float or numpy.ndarray): Elevation (meters) above WGS 84
+            datum to observe.
 
     Returns:
-        float: The minimum elevation angle (degrees) for observation.
+        float or numpy.ndarray: The minimum elevation angle (degrees) for
+        observation.
     """
-    # eta is the angular radius of the region viewable by the satellite
-    sin_eta = np.sin(np.radians(field_of_regard) / 2)
-    # rho is the angular radius of the earth viewed by the satellite
-    sin_rho = (constants.EARTH_MEAN_RADIUS + elevation) / (
-        constants.EARTH_MEAN_RADIUS + altitude
-    )
-    # epsilon is the min satellite elevation for obs (grazing angle)
-    cos_epsilon = sin_eta / sin_rho
-    if cos_epsilon > 1:
-        return 0
-    return np.degrees(np.arccos(cos_epsilon))
+    return _compute_min_elevation_angle_cached(altitude, field_of_regard, elevation)
+
+
+@vectorize(["float64(float64)"], cache=True, fastmath=True)
+def _compute_orbit_period(altitude):
+    """
+    Elementwise kernel for :func:`compute_orbit_period`.
+    """
+    semimajor_axis = _EARTH_MEAN_RADIUS + altitude
+    mean_motion_rad_s = math.sqrt(_EARTH_MU / semimajor_axis**3)
+    return 2 * math.pi / mean_motion_rad_s
 
 
-@njit
-def compute_orbit_period(altitude: float) -> float:
+_compute_orbit_period_cached = _memoize_scalars(_compute_orbit_period)
+
+
+def compute_orbit_period(
+    altitude: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Fast computation of approximate orbital period.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
 
     Returns:
-        float: The orbital period (seconds).
+        float or numpy.ndarray: The orbital period (seconds).
+    """
+    return _compute_orbit_period_cached(altitude)
+
+
+@vectorize(["float64(float64, float64)"], cache=True, fastmath=True)
+def _compute_max_access_time(altitude, min_elevation_angle):
+    """
+    Elementwise kernel for :func:`compute_max_access_time`.
     """
-    semimajor_axis = constants.EARTH_MEAN_RADIUS + altitude
-    mean_motion_rad_s = np.sqrt(constants.EARTH_MU / semimajor_axis**3)
-    return 2 * np.pi / mean_motion_rad_s
+    orbital_distance = (_EARTH_MEAN_RADIUS + altitude) * (
+        math.pi - 2 * min_elevation_angle * _D2R
+    )
+    orbital_velocity = math.sqrt(_EARTH_MU / (_EARTH_MEAN_RADIUS + altitude))
+    return orbital_distance / orbital_velocity
 
 
-@njit
-def compute_max_access_time(altitude: float, min_elevation_angle: float) -> float:
+_compute_max_access_time_cached = _memoize_scalars(_compute_max_access_time)
+
+
+def compute_max_access_time(
+    altitude: Union[float, np.ndarray],
+    min_elevation_angle: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Fast computation of maximum access time to observe a point.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        min_elevation_angle (float): Minimum elevation angle (degrees) for observation.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        min_elevation_angle (float or numpy.ndarray): Minimum elevation angle
+            (degrees) for observation.
 
     Returns:
-        float: The maximum access time (seconds) for observation.
+        float or numpy.ndarray: The maximum access time (seconds) for observation.
     """
-    orbital_distance = (constants.EARTH_MEAN_RADIUS + altitude) * (
-        np.pi - 2 * np.radians(min_elevation_angle)
-    )
-    orbital_velocity = np.sqrt(
-        constants.EARTH_MU / (constants.EARTH_MEAN_RADIUS + altitude)
+    return _compute_max_access_time_cached(altitude, min_elevation_angle)
+
+
+@vectorize(["float64(float64, float64)"], cache=True, fastmath=True)
+def _compute_ground_velocity(altitude, inclination):
+    """
+    Elementwise kernel for :func:`compute_ground_velocity`.
+    """
+    semimajor_axis = _EARTH_MEAN_RADIUS + altitude
+    mean_motion_rad_s = math.sqrt(_EARTH_MU / semimajor_axis**3)
+    return _EARTH_MEAN_RADIUS * (
+        mean_motion_rad_s
+        - (2 * math.pi * math.cos(inclination * _D2R) / _EARTH_SIDEREAL_DAY_S)
     )
-    return orbital_distance / orbital_velocity
 
 
-@njit
-def compute_ground_velocity(altitude: float, inclination: float) -> float:
+_compute_ground_velocity_cached = _memoize_scalars(_compute_ground_velocity)
+
+
+def compute_ground_velocity(
+    altitude: Union[float, np.ndarray],
+    inclination: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Fast computation of mean ground velocity for a nadir-pointing instrument.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        inclination (float): Inclination (degrees) of the observing instrument orbit.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        inclination (float or numpy.ndarray): Inclination (degrees) of the
+            observing instrument orbit.
 
     Returns:
-        float: The access time (seconds) for observation.
+        float or numpy.ndarray: The access time (seconds) for observation.
     """
-    semimajor_axis = constants.EARTH_MEAN_RADIUS + altitude
-    mean_motion_rad_s = np.sqrt(constants.EARTH_MU / semimajor_axis**3)
-    return constants.EARTH_MEAN_RADIUS * (
-        mean_motion_rad_s
-        - (2 * np.pi * np.cos(np.degrees(inclination)) / constants.EARTH_SIDEREAL_DAY_S)
-    )
+    return _compute_ground_velocity_cached(altitude, inclination)
 
 
-@njit
 def along_track_distance_to_access_time(
-    altitude: float, inclination: float, along_track: float
-) -> float:
+    altitude: Union[float, np.ndarray],
+    inclination: Union[float, np.ndarray],
+    along_track: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Fast computation of mean access time for a specified along track distance.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        inclination (float): Inclination (degrees) of the observing instrument orbit.
-        along_track (float): Along track distance (meters) observed during access.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        inclination (float or numpy.ndarray): Inclination (degrees) of the
+            observing instrument orbit.
+        along_track (float or numpy.ndarray): Along track distance (meters)
+            observed during access.
 
     Returns:
-        float: The access time (seconds) for observation.
+        float or numpy.ndarray: The access time (seconds) for observation.
     """
-    semimajor_axis = constants.EARTH_MEAN_RADIUS + altitude
-    mean_motion_rad_s = np.sqrt(constants.EARTH_MU / semimajor_axis**3)
-    ground_velocity = constants.EARTH_MEAN_RADIUS * (
-        mean_motion_rad_s
-        - (2 * np.pi * np.cos(np.degrees(inclination)) / constants.EARTH_SIDEREAL_DAY_S)
-    )
-    return along_track / ground_velocity
+    return along_track / _compute_ground_velocity_cached(altitude, inclination)
 
 
-@njit
 def access_time_to_along_track_distance(
-    altitude: float, inclination: float, access_time: float
-) -> float:
+    altitude: Union[float, np.ndarray],
+    inclination: Union[float, np.ndarray],
+    access_time: Union[float, np.ndarray],
+) -> Union[float, np.ndarray]:
     """
     Fast computation of along track distance for a specified access time.
 
     Args:
-        altitude (float): Altitude (meters) above WGS 84 datum for the observing instrument.
-        inclination (float): Inclination (degrees) of the observing instrument orbit.
-        access_time (float): Access time (seconds) during observation.
+        altitude (float or numpy.ndarray): Altitude (meters) above WGS 84 datum
+            for the observing instrument.
+        inclination (float or numpy.ndarray): Inclination (degrees) of the
+            observing instrument orbit.
+        access_time (float or numpy.ndarray): Access time (seconds) during
+            observation.
 
     Returns:
-        float: The observation along track distance (meters).
+        float or numpy.ndarray: The observation along track distance (meters).
     """
-    semimajor_axis = constants.EARTH_MEAN_RADIUS + altitude
-    mean_motion_rad_s = np.sqrt(constants.EARTH_MU / semimajor_axis**3)
-    ground_velocity = constants.EARTH_MEAN_RADIUS * (
-        mean_motion_rad_s
-        - (2 * np.pi * np.cos(np.degrees(inclination)) / constants.EARTH_SIDEREAL_DAY_S)
-    )
-    return ground_velocity * access_time
+    return _compute_ground_velocity_cached(altitude, inclination) * access_time
+
+
+def _flatten_polygons(polygons: list) -> MultiPolygon:
+    """
+    Flattens a list of Polygon or MultiPolygon components to a MultiPolygon.
+
+    Args:
+        polygons (list): The Polygon or MultiPolygon components to flatten.
+
+    Returns:
+        MultiPolygon: The flattened multi polygon.
+    """
+    return MultiPolygon(list(get_parts(polygons)))
+
+
+def _wrap_coords_over_pole(
+    coords: np.ndarray, pole_latitude: float, lon_shift: float
+) -> np.ndarray:
+    """
+    Wraps coordinates extending past a pole back into the [-90, 90] degree
+    latitude range, adjusting their longitude by 180 degrees.
+
+    Args:
+        coords (numpy.ndarray): The coordinates (N x 2) to wrap (modified in
+            place).
+        pole_latitude (float): The pole latitude (degrees): 90 (North) or -90
+            (South).
+        lon_shift (float): The longitude shift (degrees) to apply: 180 or -180.
+
+    Returns:
+        numpy.ndarray: The wrapped coordinates.
+    """
+    if pole_latitude > 0:
+        over = coords[:, 1] >= pole_latitude
+    else:
+        over = coords[:, 1] <= pole_latitude
+    coords[over, 0] += lon_shift
+    coords[over, 1] = 2 * pole_latitude - coords[over, 1]
+    return coords
 
 
 def _wrap_polygon_over_north_pole(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Wraps polygon coordinates over the North pole. Due to buffering and projection,
@@ -318,29 +564,15 @@ def _wrap_polygon_over_north_pole(
        Polygon, or MultiPolygon: The wrapped polygon.
     """
     if isinstance(polygon, Polygon):
-        if all(c[1] <= 90 for c in polygon.exterior.coords):
+        _, _, max_lon, max_lat = polygon.bounds
+        if max_lat <= 90:
             # no wrapping necessary
             return polygon
         # map latitudes from [90, 180) to [90, -90), adjusting longitude by 180 degrees
-        lat_shift = 180 if all(c[0] <= 0 for c in polygon.exterior.coords) else -180
-        pgon = Polygon(
-            [
-                [
-                    c[0] + lat_shift if c[1] >= 90 else c[0],
-                    180 - c[1] if c[1] >= 90 else c[1],
-                ]
-                for c in polygon.exterior.coords
-            ],
-            [
-                [
-                    [
-                        c[0] + lat_shift if c[1] >= 90 else c[0],
-                        180 - c[1] if c[1] >= 90 else c[1],
-                    ]
-                    for c in i.coords
-                ]
-                for i in polygon.interiors
-            ],
+        lon_shift = 180 if max_lon <= 0 else -180
+        # transform batches all rings into one coordinate array
+        pgon = transform(
+            polygon, lambda coords: _wrap_coords_over_pole(coords, 90, lon_shift)
         )
         # give up and return original polygon if invalid
         if not pgon.is_valid:
@@ -348,19 +580,14 @@ def _wrap_polygon_over_north_pole(
         return pgon
     if isinstance(polygon, MultiPolygon):
         # recursive call for each polygon
-        polygons = [_wrap_polygon_over_north_pole(p) for p in polygon.geoms]
-        return MultiPolygon(
-            [
-                g
-                for p in polygons
-                for g in (p.geoms if isinstance(p, MultiPolygon) else [p])
-            ]
+        return _flatten_polygons(
+            [_wrap_polygon_over_north_pole(p) for p in polygon.geoms]
         )
     raise ValueError("Unknown geometry: " + str(type(polygon)))
 
 
 def _split_polygon_north_pole(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Splits a Polygon into a MultiPolygon if it crosses north pole.
@@ -372,38 +599,33 @@ def _split_polygon_north_pole(
        Polygon, or MultiPolygon: The split polygon.
     """
     if isinstance(polygon, Polygon):
-        if all(c[1] <= 90 for c in polygon.exterior.coords):
+        if polygon.bounds[3] <= 90:
             # no splitting necessary
             return polygon
         # split polygon along north pole
-        parts = split(polygon, LineString([(-360, 90), (360, 90)]))
-        # check and split part over prime meridian if necessary
-        for part in parts.geoms:
-            if part.crosses(LineString([(0, 90), (0, 180)])):
-                parts = GeometryCollection(
-                    [g for g in parts.geoms if g != part]
-                    + [g for g in split(part, LineString([(0, 90), (0, 180)])).geoms]
-                )
+        parts = list(split(polygon, _NORTH_POLE_LINE).geoms)
+        # check and split parts over prime meridian if necessary, replacing
+        # each crossing part by index to avoid costly equality scans
+        index = 0
+        while index < len(parts):
+            part = parts[index]
+            if _NORTH_PRIME_MERIDIAN_LINE.crosses(part):
+                parts.pop(index)
+                parts.extend(split(part, _NORTH_PRIME_MERIDIAN_LINE).geoms)
+            else:
+                index += 1
         # convert to a multi polygon
-        if isinstance(parts, GeometryCollection):
-            parts = _convert_collection_to_polygon(parts)
+        parts = _convert_collection_to_polygon(GeometryCollection(parts))
         # return polygon with components wrapped over north pole
         return _wrap_polygon_over_north_pole(parts)
     if isinstance(polygon, MultiPolygon):
         # recursive call for each polygon
-        pgons = [_split_polygon_north_pole(p) for p in polygon.geoms]
-        return MultiPolygon(
-            [
-                g
-                for p in pgons
-                for g in (p.geoms if isinstance(p, MultiPolygon) else [p])
-            ]
-        )
+        return _flatten_polygons([_split_polygon_north_pole(p) for p in polygon.geoms])
     raise ValueError("Unknown geometry: " + str(type(polygon)))
 
 
 def _wrap_polygon_over_south_pole(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Wraps polygon coordinates over the South pole. Due to buffering and projection,
@@ -421,29 +643,15 @@ def _wrap_polygon_over_south_pole(
        Polygon, or MultiPolygon: The wrapped polygon.
     """
     if isinstance(polygon, Polygon):
-        if all(c[1] >= -90 for c in polygon.exterior.coords):
-            # no splitting necessary
+        _, min_lat, max_lon, _ = polygon.bounds
+        if min_lat >= -90:
+            # no wrapping necessary
             return polygon
         # map latitudes from [-90, -180) to [-90, 90), adjusting longitude by 180 degrees
-        lat_shift = 180 if all(c[0] <= 0 for c in polygon.exterior.coords) else -180
-        pgon = Polygon(
-            [
-                [
-                    c[0] + lat_shift if c[1] <= -90 else c[0],
-                    -180 - c[1] if c[1] <= -90 else c[1],
-                ]
-                for c in polygon.exterior.coords
-            ],
-            [
-                [
-                    [
-                        (c[0] + lat_shift if c[1] <= -90 else c[0],),
-                        -180 - c[1] if c[1] <= -90 else c[1],
-                    ]
-                    for c in i.coords
-                ]
-                for i in polygon.interiors
-            ],
+        lon_shift = 180 if max_lon <= 0 else -180
+        # transform batches all rings into one coordinate array
+        pgon = transform(
+            polygon, lambda coords: _wrap_coords_over_pole(coords, -90, lon_shift)
         )
         # give up and return original polygon if invalid
         if not pgon.is_valid:
@@ -451,19 +659,14 @@ def _wrap_polygon_over_south_pole(
         return pgon
     if isinstance(polygon, MultiPolygon):
         # recursive call for each polygon
-        polygons = [_wrap_polygon_over_south_pole(p) for p in polygon.geoms]
-        return MultiPolygon(
-            [
-                g
-                for p in polygons
-                for g in (p.geoms if isinstance(p, MultiPolygon) else [p])
-            ]
+        return _flatten_polygons(
+            [_wrap_polygon_over_south_pole(p) for p in polygon.geoms]
         )
     raise ValueError("Unknown geometry: " + str(type(polygon)))
 
 
 def _split_polygon_south_pole(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Splits a Polygon into a MultiPolygon if it crosses south pole.
@@ -475,38 +678,33 @@ def _split_polygon_south_pole(
        Polygon, or MultiPolygon: The split polygon.
     """
     if isinstance(polygon, Polygon):
-        lat = np.array([c[1] for c in polygon.exterior.coords])
-        if np.all(lat >= -90):
+        if polygon.bounds[1] >= -90:
+            # no splitting necessary
             return polygon
         # split polygon along south pole
-        parts = split(polygon, LineString([(-360, -90), (360, -90)]))
-        # check and split part over prime meridian if necessary
-        for part in parts.geoms:
-            if part.crosses(LineString([(0, -90), (0, -180)])):
-                parts = GeometryCollection(
-                    [g for g in parts.geoms if g != part]
-                    + [g for g in split(part, LineString([(0, -90), (0, -180)])).geoms]
-                )
+        parts = list(split(polygon, _SOUTH_POLE_LINE).geoms)
+        # check and split parts over prime meridian if necessary, replacing
+        # each crossing part by index to avoid costly equality scans
+        index = 0
+        while index < len(parts):
+            part = parts[index]
+            if _SOUTH_PRIME_MERIDIAN_LINE.crosses(part):
+                parts.pop(index)
+                parts.extend(split(part, _SOUTH_PRIME_MERIDIAN_LINE).geoms)
+            else:
+                index += 1
         # convert to a multi polygon
-        if isinstance(parts, GeometryCollection):
-            parts = _convert_collection_to_polygon(parts)
+        parts = _convert_collection_to_polygon(GeometryCollection(parts))
         # return polygon with components wrapped over south pole
         return _wrap_polygon_over_south_pole(parts)
     if isinstance(polygon, MultiPolygon):
         # recursive call for each polygon
-        pgons = [_split_polygon_south_pole(p) for p in polygon.geoms]
-        return MultiPolygon(
-            [
-                g
-                for p in pgons
-                for g in (p.geoms if isinstance(p, MultiPolygon) else [p])
-            ]
-        )
+        return _flatten_polygons([_split_polygon_south_pole(p) for p in polygon.geoms])
     raise ValueError("Unknown geometry: " + str(type(polygon)))
 
 
 def _wrap_polygon_over_antimeridian(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Wraps polygon coordinates over the antimeridian. Due to buffering and projection,
@@ -522,34 +720,29 @@ def _wrap_polygon_over_antimeridian(
        Polygon, or MultiPolygon: The wrapped polygon.
     """
     if isinstance(polygon, Polygon):
-        if all(c[0] >= -180 and c[0] <= 180 for c in polygon.exterior.coords):
+        min_lon, _, max_lon, _ = polygon.bounds
+        if min_lon >= -180 and max_lon <= 180:
             # no wrapping necessary
             return polygon
-        if all(c[0] <= -180 for c in polygon.exterior.coords):
+        if max_lon <= -180:
             # map longitudes from (-540, -180] to (-180, 180]
-            pgon = Polygon(
-                [[c[0] + 360, c[1]] for c in polygon.exterior.coords],
-                [[[c[0] + 360, c[1]] for c in i.coords] for i in polygon.interiors],
-            )
-        if all(c[0] >= 180 for c in polygon.exterior.coords):
+            lon_shift = 360
+        elif min_lon >= 180:
             # map longitudes from [180, 540) to [-180, 180)
-            pgon = Polygon(
-                [[c[0] - 360, c[1]] for c in polygon.exterior.coords],
-                [[[c[0] - 360, c[1]] for c in i.coords] for i in polygon.interiors],
-            )
+            lon_shift = -360
+        else:
+            # give up: longitudes straddling the antimeridian require a split
+            return polygon
+        # transform batches all rings into one coordinate array
+        pgon = transform(polygon, lambda coords: coords + [lon_shift, 0])
         # give up and return original polygon if invalid
         if not pgon.is_valid:
             return polygon
         return pgon
     if isinstance(polygon, MultiPolygon):
         # recursive call for each polygon
-        pgons = [_wrap_polygon_over_antimeridian(p) for p in polygon.geoms]
-        return MultiPolygon(
-            [
-                g
-                for p in pgons
-                for g in (p.geoms if isinstance(p, MultiPolygon) else [p])
-            ]
+        return _flatten_polygons(
+            [_wrap_polygon_over_antimeridian(p) for p in polygon.geoms]
         )
     raise ValueError("Unknown geometry: " + str(type(polygon)))
 
@@ -578,7 +771,7 @@ def _convert_collection_to_polygon(
 
 
 def _split_polygon_antimeridian(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Splits a Polygon into a MultiPolygon if it crosses the anti-meridian after
@@ -592,35 +785,36 @@ def _split_polygon_antimeridian(
        Polygon, or MultiPolygon: The split polygon.
     """
     if isinstance(polygon, Polygon):
-        lon = np.array([c[0] for c in polygon.exterior.coords])
+        min_lon, _, max_lon, _ = polygon.bounds
+        if max_lon - min_lon < 180:
+            # longitude span too narrow to cross the anti-meridian
+            return polygon
+        exterior = get_coordinates(polygon.exterior)
+        lon = exterior[:, 0]
         # check if any longitudes cross the anti-meridian
         # (adjacent coordinate longitude differs by more than 180 degrees)
-        if all(np.abs(np.diff(lon)) < 180):
+        if np.all(np.abs(np.diff(lon)) < 180):
             return polygon
         # find anti-meridian crossings and calculate shift direction
         # coords from W -> E (shift < 0) will add 360 degrees to E component
         # coords from E -> W (shift > 0) will subtract 360 degrees from W component
         shift = np.insert(np.cumsum(np.around(np.diff(lon) / 360)), 0, 0)
-        pgon = Polygon(
-            [
-                (c[0] - 360 * shift[i], c[1])
-                for i, c in enumerate(polygon.exterior.coords)
-            ],
-            [
-                [
-                    (
-                        ic[0]
-                        - 360 * np.interp(ic[0], np.sort(lon), shift[np.argsort(lon)]),
-                        ic[1],
-                    )
-                    for ic in i.coords
-                ]
-                for i in polygon.interiors
-            ],
-        )
+        # hoist the interpolation table for interior shifts out of the loop
+        sort_index = np.argsort(lon)
+        sorted_lon = lon[sort_index]
+        sorted_shift = shift[sort_index]
+        interiors = []
+        for interior in polygon.interiors:
+            coords = get_coordinates(interior)
+            coords[:, 0] -= 360 * np.interp(coords[:, 0], sorted_lon, sorted_shift)
+            interiors.append(coords)
+        exterior[:, 0] -= 360 * shift
+        pgon = Polygon(exterior, interiors)
         # split along the anti-meridian (-180 for shift > 0; 180 for shift < 0)
-        shift_dir = -180 if shift.max() >= 1 else 180
-        parts = split(pgon, LineString([(shift_dir, -180), (shift_dir, 180)]))
+        if shift.max() >= 1:
+            parts = split(pgon, _ANTIMERIDIAN_WEST_LINE)
+        else:
+            parts = split(pgon, _ANTIMERIDIAN_EAST_LINE)
         # convert to multi polygon
         if isinstance(parts, GeometryCollection):
             parts = _convert_collection_to_polygon(parts)
@@ -628,19 +822,14 @@ def _split_polygon_antimeridian(
         return _wrap_polygon_over_antimeridian(parts)
     if isinstance(polygon, MultiPolygon):
         # recursive call for each polygon
-        pgons = [_split_polygon_antimeridian(p) for p in polygon.geoms]
-        return MultiPolygon(
-            [
-                g
-                for p in pgons
-                for g in (p.geoms if isinstance(p, MultiPolygon) else [p])
-            ]
+        return _flatten_polygons(
+            [_split_polygon_antimeridian(p) for p in polygon.geoms]
         )
     raise ValueError("Unknown geometry: " + str(type(polygon)))
 
 
 def split_polygon(
-    polygon: Union[Polygon, MultiPolygon]
+    polygon: Union[Polygon, MultiPolygon],
 ) -> Union[Polygon, MultiPolygon]:
     """
     Splits a Polygon into a MultiPolygon if it crosses the anti-meridian
@@ -660,7 +849,7 @@ def split_polygon(
 
 
 def normalize_geometry(
-    geometry: Union[Polygon, MultiPolygon, gpd.GeoDataFrame]
+    geometry: Union[Polygon, MultiPolygon, gpd.GeoDataFrame],
 ) -> gpd.GeoDataFrame:
     """
     Normalize geometry to a GeoDataFrame with antimeridian wrapping.
@@ -674,14 +863,15 @@ def normalize_geometry(
     if isinstance(geometry, (Polygon, MultiPolygon)):
         if not geometry.is_valid:
             raise ValueError("Geometry is not a valid Polygon or MultiPolygon.")
-        geometry = gpd.GeoDataFrame(geometry=gpd.GeoSeries([geometry]), crs="EPSG:4326")
-    elif isinstance(geometry, gpd.GeoSeries):
+        # short-circuit: split the bare geometry and box it in a frame once
+        return gpd.GeoDataFrame(
+            geometry=gpd.GeoSeries([split_polygon(geometry)]), crs="EPSG:4326"
+        )
+    if isinstance(geometry, gpd.GeoSeries):
         geometry = gpd.GeoDataFrame(geometry=geometry, crs="EPSG:4326")
     if isinstance(geometry, gpd.GeoDataFrame):
-        geometry["geometry"] = geometry.apply(
-            lambda r: split_polygon(r.geometry),
-            axis=1,
-        )
+        # iterate the geometry column directly rather than a row-wise apply
+        geometry["geometry"] = [split_polygon(g) for g in geometry.geometry.values]
     return geometry
 
 
@@ -697,5 +887,4 @@ def zero_pad(object_name: str, max_number: int, current_number: int) -> str:
     Returns:
         str: The object name with zero padded number appended.
     """
-    max_length = len(str(max_number))
-    return object_name + " " + str(current_number).zfill(max_length)
+    return f"{object_name} {current_number:0{len(str(max_number))}d}"
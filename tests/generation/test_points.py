@@ -86,6 +86,27 @@ class TestPointGenerators(unittest.TestCase):
             delta=0.20 * distance,
         )
 
+    def test_generate_fibonacci_lattice_points_chunked(self):
+        distance = 2000000
+        points = generate_fibonacci_lattice_points(distance)
+        chunked = generate_fibonacci_lattice_points(distance, chunk_size=50)
+        self.assertEqual(chunked.crs, points.crs)
+        self.assertTrue(chunked.equals(points))
+
+    def test_generate_fibonacci_lattice_points_chunked_mask(self):
+        distance = 2000000
+        mask = Polygon([[-100, 25], [-50, 25], [-50, -25], [-100, -25], [-100, 25]])
+        points = generate_fibonacci_lattice_points(distance, mask=mask)
+        chunked = generate_fibonacci_lattice_points(distance, mask=mask, chunk_size=7)
+        self.assertEqual(chunked.crs, points.crs)
+        self.assertTrue(chunked.equals(points))
+
+    def test_generate_fibonacci_lattice_points_chunked_mask_small(self):
+        distance = 2000000
+        mask = Polygon([[0, 0], [1, 0], [1, 1], [0, 1], [0, 0]])
+        points = generate_fibonacci_lattice_points(distance, mask=mask, chunk_size=10)
+        self.assertEqual(len(points), 0)
+
     def test_generate_equally_spaced_points_no_mask_distance(self):
         distance = 2000000
         points = generate_equally_spaced_points(distance)
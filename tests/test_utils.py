@@ -13,6 +13,9 @@ from tatc.utils import (
     compute_field_of_regard,
     compute_min_elevation_angle,
     compute_max_access_time,
+    compute_ground_velocity,
+    along_track_distance_to_access_time,
+    access_time_to_along_track_distance,
     split_polygon,
     normalize_geometry,
 )
@@ -31,6 +34,24 @@ class TestUtils(unittest.TestCase):
             true_anomaly_to_mean_anomaly(78.95065818, 0.0001492), 78.940629, delta=0.01
         )
 
+    def test_mean_anomaly_to_true_anomaly_array(self):
+        mean_anomaly = np.array([0.0, 78.940629, 250.0])
+        result = mean_anomaly_to_true_anomaly(mean_anomaly, 0.0001492)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, mean_anomaly_to_true_anomaly(mean_anomaly[i], 0.0001492)
+            )
+
+    def test_true_anomaly_to_mean_anomaly_array(self):
+        true_anomaly = np.array([0.0, 78.95065818, 250.0])
+        result = true_anomaly_to_mean_anomaly(true_anomaly, 0.0001492)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, true_anomaly_to_mean_anomaly(true_anomaly[i], 0.0001492)
+            )
+
     def test_compute_number_samples(self):
         # rough approximation based on flat sample areas
         sample_distance = 10000
@@ -67,6 +88,82 @@ class TestUtils(unittest.TestCase):
             compute_max_access_time(705000, 81.66446), 274.31828, delta=0.001
         )
 
+    def test_compute_ground_velocity(self):
+        # sun-synchronous orbit: retrograde inclination increases the
+        # ground velocity above the prograde equivalent
+        self.assertAlmostEqual(
+            compute_ground_velocity(705000, 98.2), 6823.89488, delta=0.001
+        )
+        self.assertAlmostEqual(
+            compute_ground_velocity(400000, 51.6), 6930.75852, delta=0.001
+        )
+
+    def test_along_track_distance_to_access_time(self):
+        self.assertAlmostEqual(
+            along_track_distance_to_access_time(705000, 98.2, 185815),
+            27.23005,
+            delta=0.001,
+        )
+
+    def test_access_time_to_along_track_distance(self):
+        self.assertAlmostEqual(
+            access_time_to_along_track_distance(
+                705000, 98.2, along_track_distance_to_access_time(705000, 98.2, 185815)
+            ),
+            185815,
+            delta=0.001,
+        )
+
+    def test_swath_width_to_field_of_regard_array(self):
+        altitude = np.array([705000.0, 400000.0])
+        swath_width = np.array([185815.0, 100000.0])
+        result = swath_width_to_field_of_regard(altitude, swath_width)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, swath_width_to_field_of_regard(altitude[i], swath_width[i])
+            )
+
+    def test_field_of_regard_to_swath_width_array(self):
+        altitude = np.array([705000.0, 400000.0])
+        field_of_regard = np.array([15.0, 20.0])
+        result = field_of_regard_to_swath_width(altitude, field_of_regard)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, field_of_regard_to_swath_width(altitude[i], field_of_regard[i])
+            )
+
+    def test_compute_field_of_regard_array(self):
+        altitude = np.array([705000.0, 400000.0])
+        min_elevation_angle = np.array([81.66446, 45.0])
+        result = compute_field_of_regard(altitude, min_elevation_angle)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, compute_field_of_regard(altitude[i], min_elevation_angle[i])
+            )
+
+    def test_compute_min_elevation_angle_array(self):
+        altitude = np.array([705000.0, 30000000.0])
+        field_of_regard = np.array([15.0, 180.0])
+        result = compute_min_elevation_angle(altitude, field_of_regard)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, compute_min_elevation_angle(altitude[i], field_of_regard[i])
+            )
+
+    def test_compute_max_access_time_array(self):
+        altitude = np.array([705000.0, 400000.0])
+        min_elevation_angle = np.array([81.66446, 45.0])
+        result = compute_max_access_time(altitude, min_elevation_angle)
+        self.assertIsInstance(result, np.ndarray)
+        for i, value in enumerate(result):
+            self.assertAlmostEqual(
+                value, compute_max_access_time(altitude[i], min_elevation_angle[i])
+            )
+
     def test_split_polygon_nominal_small(self):
         polygon = Polygon([(-10, 10), (10, 10), (10, -10), (-10, -10), (-10, 10)])
         self.assertEqual(split_polygon(polygon), polygon)